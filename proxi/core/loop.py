@@ -393,14 +393,13 @@ class AgentLoop:
 
                                 # Partition into safe (parallelisable) and unsafe (sequential).
                                 # Pass args so call_tool delegation can check the inner tool.
-                                safe_indices = [
-                                    i for i, (_, name, args) in enumerate(parsed_calls)
-                                    if self.tool_registry.is_parallel_safe(name, args)
-                                ]
-                                unsafe_indices = [
-                                    i for i, (_, name, args) in enumerate(parsed_calls)
-                                    if not self.tool_registry.is_parallel_safe(name, args)
-                                ]
+                                safe_indices: list[int] = []
+                                unsafe_indices: list[int] = []
+                                for i, (_, name, args) in enumerate(parsed_calls):
+                                    if self.tool_registry.is_parallel_safe(name, args):
+                                        safe_indices.append(i)
+                                    else:
+                                        unsafe_indices.append(i)
 
                                 results_by_index: dict[int, dict[str, Any]] = {}
 
@@ -452,9 +451,11 @@ class AgentLoop:
 
                                 # Add all tool response messages
                                 observe_start_ns = now_ns()
+                                observations: list[str] = []
                                 for action_result in action_results:
                                     observation = self._observe(
                                         action_result["result"])
+                                    observations.append(observation)
                                     state.add_message(
                                         Message(
                                             role="tool",
@@ -468,8 +469,7 @@ class AgentLoop:
                                 turn.status = TurnStatus.OBSERVING
                                 turn.action_result = {
                                     "type": "multiple_tool_calls", "results": action_results}
-                                turn.observation = "\n".join(
-                                    [self._observe(r["result"]) for r in action_results])
+                                turn.observation = "\n".join(observations)
                                 observe_ms += elapsed_ms(observe_start_ns)
                             else:
                                 # Single tool call - original behavior
@@ -4,8 +4,36 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+import httpx
+
 from proxi.gateway.events import GatewayEvent
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def reply_http_client() -> httpx.AsyncClient:
+    """Shared client for outbound channel replies.
+
+    Reusing one client keeps TLS connections to each channel API alive between
+    replies instead of handshaking per message. Connection failures are retried
+    by the transport; requests that reached the server are not.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=15.0,
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _http_client
+
+
+async def close_reply_http_client() -> None:
+    """Close the shared reply client; called on gateway shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class ChannelAdapter(ABC):
     """Parses one channel's wire format into a ``GatewayEvent``.
@@ -10,9 +10,7 @@ from __future__ import annotations
 import os
 from typing import Any
 
-import httpx
-
-from proxi.gateway.channels.base import ChannelAdapter
+from proxi.gateway.channels.base import ChannelAdapter, reply_http_client
 from proxi.gateway.events import GatewayEvent, ReplyChannel
 from proxi.observability.logging import get_logger
 
@@ -32,12 +30,11 @@ class DiscordReplyChannel(ReplyChannel):
             _log.warning("discord_reply_skipped", reason="channel_id is empty")
             return
         # destination is channel_id for text channels
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(
-                f"https://discord.com/api/v10/channels/{self.destination}/messages",
-                headers={"Authorization": f"Bot {token}"},
-                json={"content": text[:2000]},
-            )
+        resp = await reply_http_client().post(
+            f"https://discord.com/api/v10/channels/{self.destination}/messages",
+            headers={"Authorization": f"Bot {token}"},
+            json={"content": text[:2000]},
+        )
         if resp.status_code not in (200, 201):
             _log.warning(
                 "discord_reply_failed",
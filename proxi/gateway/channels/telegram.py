@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import os
 
-import httpx
-
-from proxi.gateway.channels.base import ChannelAdapter
+from proxi.gateway.channels.base import ChannelAdapter, reply_http_client
 from proxi.gateway.events import GatewayEvent, ReplyChannel
 
 
@@ -19,16 +17,16 @@ class TelegramReplyChannel(ReplyChannel):
             return
         # Telegram limits messages to 4096 chars; chunk if needed
         chunks = [text[i : i + 4096] for i in range(0, len(text), 4096)]
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            for chunk in chunks:
-                await client.post(
-                    f"https://api.telegram.org/bot{token}/sendMessage",
-                    json={
-                        "chat_id": self.destination,
-                        "text": chunk,
-                        "parse_mode": "Markdown",
-                    },
-                )
+        client = reply_http_client()
+        for chunk in chunks:
+            await client.post(
+                f"https://api.telegram.org/bot{token}/sendMessage",
+                json={
+                    "chat_id": self.destination,
+                    "text": chunk,
+                    "parse_mode": "Markdown",
+                },
+            )
 
 
 class TelegramAdapter(ChannelAdapter):
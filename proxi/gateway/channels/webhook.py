@@ -12,6 +12,8 @@ import re
 from proxi.gateway.config import SourceConfig
 from proxi.gateway.events import GatewayEvent
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(.+?)\}\}")
+
 
 def render_prompt_template(template: str, data: dict) -> str:
     """Substitute ``{{dotted.path}}`` placeholders with values from *data*.
@@ -19,6 +21,8 @@ def render_prompt_template(template: str, data: dict) -> str:
     Nested keys are resolved via dot notation (e.g. ``{{repository.name}}``).
     Missing keys are replaced with the literal placeholder string.
     """
+    if "{{" not in template:
+        return template
 
     def _resolve(match: re.Match[str]) -> str:
         key_path = match.group(1).strip()
@@ -30,7 +34,7 @@ def render_prompt_template(template: str, data: dict) -> str:
                 return match.group(0)
         return str(value)
 
-    return re.sub(r"\{\{(.+?)\}\}", _resolve, template)
+    return _PLACEHOLDER_RE.sub(_resolve, template)
 
 
 def build_webhook_event(source: SourceConfig, raw: dict) -> GatewayEvent:
@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import os
 
-import httpx
-
-from proxi.gateway.channels.base import ChannelAdapter
+from proxi.gateway.channels.base import ChannelAdapter, reply_http_client
 from proxi.gateway.events import GatewayEvent, ReplyChannel
 
 
@@ -18,17 +16,16 @@ class WhatsAppReplyChannel(ReplyChannel):
         phone_id = os.environ.get("WHATSAPP_PHONE_NUMBER_ID", "")
         if not token or not phone_id:
             return
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            await client.post(
-                f"https://graph.facebook.com/v21.0/{phone_id}/messages",
-                headers={"Authorization": f"Bearer {token}"},
-                json={
-                    "messaging_product": "whatsapp",
-                    "to": self.destination,
-                    "type": "text",
-                    "text": {"body": text},
-                },
-            )
+        await reply_http_client().post(
+            f"https://graph.facebook.com/v21.0/{phone_id}/messages",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "messaging_product": "whatsapp",
+                "to": self.destination,
+                "type": "text",
+                "text": {"body": text},
+            },
+        )
 
 
 class WhatsAppAdapter(ChannelAdapter):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -63,12 +64,12 @@ def _build_summarizer_client(llm_client: Any) -> Any:
     if current_model == target_model:
         return llm_client
 
-    try:
-        from proxi.cli.main import create_llm_client
-        return create_llm_client(provider=provider, model=target_model)
-    except Exception:
-        # API key missing or other setup error — fall back to the main client.
-        return llm_client
+    # Same provider and credentials, different model: a shallow copy shares the
+    # SDK client (and its connection pool) instead of building a new one per
+    # summarized session.
+    summarizer = copy.copy(llm_client)
+    summarizer.model = target_model
+    return summarizer
 
 
 async def _summarize_session(
@@ -80,8 +81,7 @@ async def _summarize_session(
 ) -> None:
     """Background task: summarize a completed session and store in episodic memory."""
     # Only summarize sessions with meaningful content (at least 3 user turns)
-    user_msgs = [m for m in history if getattr(m, "role", None) == "user"]
-    if len(user_msgs) < 3:
+    if sum(1 for m in history if getattr(m, "role", None) == "user") < 3:
         return
 
     # Build a compact transcript (skip large tool results)
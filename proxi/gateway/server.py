@@ -10,7 +10,6 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
-import uvicorn
 import yaml
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
@@ -26,6 +25,7 @@ from proxi.cli.main import (
 from proxi.core.compactor import ContextCompactor
 from proxi.core.loop import AgentLoop
 from proxi.core.state import WorkspaceConfig
+from proxi.gateway.channels.base import close_reply_http_client
 from proxi.gateway.channels.cron import CronRegistry, _parse_cron
 from proxi.gateway.channels.discord import DiscordAdapter
 from proxi.gateway.channels.heartbeat import HeartbeatManager
@@ -458,6 +458,7 @@ async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
             logger.warning("mcp_close_error", error=str(exc))
     _mcp_adapters.clear()
     _integration_tools.clear()
+    await close_reply_http_client()
     # Plans are ephemeral — delete them on every shutdown.
     _purge_all_plans(workspace_root)
     logger.info("gateway_stopped")
@@ -1754,6 +1755,10 @@ async def health() -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 def main() -> None:
     """``proxi-gateway`` entry point."""
+    # Imported here so importing the app module (lanes, tests) skips uvicorn.
+    # uvicorn's default loop="auto" already selects uvloop when it is installed
+    # (uvicorn[standard] pulls it in on POSIX).
+    import uvicorn
     from dotenv import load_dotenv
 
     load_dotenv()
@@ -53,6 +53,7 @@ INTEGRATIONS: dict[str, Integration] = {
 }
 
 # Prefix-based tool → integration routing.
+# Each prefix is a single ``<namespace>_`` segment so lookups can key on it.
 TOOL_INTEGRATION_PREFIXES: tuple[tuple[str, str], ...] = (
     ("calendar_", "google_calendar"),
     ("spotify_", "spotify"),
@@ -61,6 +62,11 @@ TOOL_INTEGRATION_PREFIXES: tuple[tuple[str, str], ...] = (
     ("obsidian_", "obsidian"),
 )
 
+_INTEGRATION_BY_NAMESPACE: dict[str, str] = {
+    prefix.removesuffix("_"): integration_name
+    for prefix, integration_name in TOOL_INTEGRATION_PREFIXES
+}
+
 # Exact-name routing for tools that do not use an integration prefix.
 TOOL_INTEGRATION_EXACT: dict[str, str] = {
     "read_emails": "gmail",
@@ -80,10 +86,10 @@ def tool_integration(tool_name: str) -> str | None:
     if exact:
         return exact
 
-    for prefix, integration_name in TOOL_INTEGRATION_PREFIXES:
-        if tool_name.startswith(prefix):
-            return integration_name
-    return None
+    namespace, sep, _ = tool_name.partition("_")
+    if not sep:
+        return None
+    return _INTEGRATION_BY_NAMESPACE.get(namespace)
 
 
 def normalize_integration_names(names: Iterable[str]) -> list[str]:
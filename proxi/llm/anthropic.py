@@ -46,14 +46,19 @@ class AnthropicClient:
         return result
 
     def _convert_tools(self, tools: Sequence[ToolSpec]) -> list[dict[str, Any]]:
-        """Convert tool specs to Anthropic format."""
+        """Convert tool specs to Anthropic format.
+
+        Tools are rendered ahead of the system prompt, so they are sorted by
+        name to keep the cached prefix byte-identical when the live tool set
+        is reordered (e.g. after a deferred tool is promoted).
+        """
         return [
             {
                 "name": tool.name,
                 "description": tool.description,
                 "input_schema": tool.parameters,
             }
-            for tool in tools
+            for tool in sorted(tools, key=lambda t: t.name)
         ]
 
     async def generate(
@@ -4,8 +4,11 @@ import difflib
 import json
 import os
 import re
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from zoneinfo import ZoneInfo, available_timezones
 
@@ -27,6 +30,90 @@ SHARED_GOOGLE_SCOPES = [
     "https://www.googleapis.com/auth/calendar",
 ]
 
+# Shared read-only fallback for missing start/end blocks in API payloads.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Google's batch endpoint accepts at most 50 calls per HTTP request.
+_BATCH_LIMIT = 50
+
+# Accept inputs like "1030am", "10:30 am", "7pm", "17:00", "tomorrow at 5pm".
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2})(?::?(\d{2}))?\s*(am|pm)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_TIMEZONE_ALIASES = {
+    "est": "America/New_York",
+    "edt": "America/New_York",
+    "eastern": "America/New_York",
+    "eastern time": "America/New_York",
+    "cst": "America/Chicago",
+    "cdt": "America/Chicago",
+    "central": "America/Chicago",
+    "central time": "America/Chicago",
+    "mst": "America/Denver",
+    "mdt": "America/Denver",
+    "mountain": "America/Denver",
+    "mountain time": "America/Denver",
+    "pst": "America/Los_Angeles",
+    "pdt": "America/Los_Angeles",
+    "pacific": "America/Los_Angeles",
+    "pacific time": "America/Los_Angeles",
+    "utc": "UTC",
+    "gmt": "UTC",
+}
+
+_COMMON_TIMEZONES = frozenset({
+    "UTC",
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "America/Anchorage",
+    "Pacific/Honolulu",
+    "America/Toronto",
+    "America/Mexico_City",
+    "America/Bogota",
+    "America/Lima",
+    "America/Caracas",
+    "America/Argentina/Buenos_Aires",
+    "America/Sao_Paulo",
+    "America/Godthab",
+    "Atlantic/Azores",
+    "Atlantic/Cape_Verde",
+    "Europe/London",
+    "Europe/Dublin",
+    "Europe/Paris",
+    "Europe/Berlin",
+    "Europe/Amsterdam",
+    "Europe/Brussels",
+    "Europe/Vienna",
+    "Europe/Prague",
+    "Europe/Warsaw",
+    "Europe/Athens",
+    "Europe/Helsinki",
+    "Europe/Istanbul",
+    "Europe/Moscow",
+    "Asia/Dubai",
+    "Asia/Kolkata",
+    "Asia/Bangkok",
+    "Asia/Hong_Kong",
+    "Asia/Tokyo",
+    "Asia/Seoul",
+    "Asia/Shanghai",
+    "Australia/Sydney",
+    "Australia/Melbourne",
+    "Pacific/Auckland",
+})
+
+
+@lru_cache(maxsize=1)
+def _timezones_by_lower() -> dict[str, str]:
+    """Map lower-cased IANA names to canonical ones.
+
+    ``available_timezones()`` walks the tz database on disk on every call, so
+    the fuzzy-match table is built once per process.
+    """
+    return {tz.lower(): tz for tz in available_timezones()}
+
 
 class CalendarTools:
     """Tools for interacting with Google Calendar API."""
@@ -99,8 +186,8 @@ class CalendarTools:
     @staticmethod
     def _parse_rfc3339(value: str) -> datetime:
         """Parse RFC3339 datetime strings including Z suffix."""
-        normalized = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(normalized)
+        # fromisoformat handles "Z" and the full ISO 8601 grammar in C on 3.11+.
+        return datetime.fromisoformat(value)
 
     @staticmethod
     def _normalize_timezone(raw_timezone: str) -> str | None:
@@ -108,31 +195,10 @@ class CalendarTools:
         if not raw_timezone or not raw_timezone.strip():
             return None
 
-        aliases = {
-            "est": "America/New_York",
-            "edt": "America/New_York",
-            "eastern": "America/New_York",
-            "eastern time": "America/New_York",
-            "cst": "America/Chicago",
-            "cdt": "America/Chicago",
-            "central": "America/Chicago",
-            "central time": "America/Chicago",
-            "mst": "America/Denver",
-            "mdt": "America/Denver",
-            "mountain": "America/Denver",
-            "mountain time": "America/Denver",
-            "pst": "America/Los_Angeles",
-            "pdt": "America/Los_Angeles",
-            "pacific": "America/Los_Angeles",
-            "pacific time": "America/Los_Angeles",
-            "utc": "UTC",
-            "gmt": "UTC",
-        }
-
         raw = raw_timezone.strip()
         lowered = raw.lower()
-        if lowered in aliases:
-            return aliases[lowered]
+        if lowered in _TIMEZONE_ALIASES:
+            return _TIMEZONE_ALIASES[lowered]
 
         # Try direct validation with ZoneInfo first (works on most systems)
         try:
@@ -142,68 +208,23 @@ class CalendarTools:
             pass
 
         # Fallback: check against static list of common IANA timezones (Windows compatibility)
-        common_timezones = {
-            "UTC",
-            "America/New_York",
-            "America/Chicago",
-            "America/Denver",
-            "America/Los_Angeles",
-            "America/Anchorage",
-            "Pacific/Honolulu",
-            "America/Toronto",
-            "America/Mexico_City",
-            "America/Bogota",
-            "America/Lima",
-            "America/Caracas",
-            "America/Argentina/Buenos_Aires",
-            "America/Sao_Paulo",
-            "America/Godthab",
-            "Atlantic/Azores",
-            "Atlantic/Cape_Verde",
-            "Europe/London",
-            "Europe/Dublin",
-            "Europe/Paris",
-            "Europe/Berlin",
-            "Europe/Amsterdam",
-            "Europe/Brussels",
-            "Europe/Vienna",
-            "Europe/Prague",
-            "Europe/Warsaw",
-            "Europe/Athens",
-            "Europe/Helsinki",
-            "Europe/Istanbul",
-            "Europe/Moscow",
-            "Asia/Dubai",
-            "Asia/Kolkata",
-            "Asia/Bangkok",
-            "Asia/Hong_Kong",
-            "Asia/Tokyo",
-            "Asia/Seoul",
-            "Asia/Shanghai",
-            "Australia/Sydney",
-            "Australia/Melbourne",
-            "Pacific/Auckland",
-        }
-
-        if raw in common_timezones:
+        if raw in _COMMON_TIMEZONES:
             return raw
 
         # Normalize separators and case: "america/net york" -> "America/Net_York".
         normalized = raw.replace("\\", "/").replace("-", "_").strip()
-        normalized = re.sub(r"\s+", "_", normalized)
+        normalized = _WHITESPACE_RE.sub("_", normalized)
         normalized = "/".join(part.capitalize() for part in normalized.split("/"))
-        if normalized in common_timezones:
+        if normalized in _COMMON_TIMEZONES:
             return normalized
 
         # Try fuzzy matching only if available_timezones() returns results
         try:
-            all_tzs = available_timezones()
-            if all_tzs:  # Only attempt if we have timezone data
-                tz_by_lower = {tz.lower(): tz for tz in all_tzs}
-                fuzzy_target = normalized.lower()
+            tz_by_lower = _timezones_by_lower()
+            if tz_by_lower:  # Only attempt if we have timezone data
                 match = difflib.get_close_matches(
-                    fuzzy_target,
-                    list(tz_by_lower.keys()),
+                    normalized.lower(),
+                    tz_by_lower,
                     n=1,
                     cutoff=0.78,
                 )
@@ -238,8 +259,7 @@ class CalendarTools:
         elif fallback_date is not None:
             date_hint = fallback_date.astimezone(tz).date()
 
-        # Accept inputs like "1030am", "10:30 am", "7pm", "17:00", "tomorrow at 5pm".
-        match = re.search(r"(\d{1,2})(?::?(\d{2}))?\s*(am|pm)?", lower)
+        match = _CLOCK_TIME_RE.search(lower)
         if not match:
             return None
 
@@ -360,10 +380,10 @@ class CalendarTools:
                 fallback_date=start_dt,
             )
 
+            # start_dt was already parsed above; only the end still needs it.
             try:
-                if normalized_start is None or normalized_end is None:
+                if start_dt is None or normalized_end is None:
                     raise ValueError("missing normalized datetime")
-                start_dt = self._parse_rfc3339(normalized_start)
                 end_dt = self._parse_rfc3339(normalized_end)
             except ValueError:
                 return {
@@ -403,8 +423,8 @@ class CalendarTools:
                 "calendar_id": calendar_id,
                 "summary": created.get("summary", summary),
                 "html_link": created.get("htmlLink", ""),
-                "start": (created.get("start", {}) or {}).get("dateTime"),
-                "end": (created.get("end", {}) or {}).get("dateTime"),
+                "start": (created.get("start") or _EMPTY).get("dateTime"),
+                "end": (created.get("end") or _EMPTY).get("dateTime"),
             }
 
         except HttpError as e:
@@ -465,8 +485,8 @@ class CalendarTools:
                 event["location"] = location
 
             if start_time is not None or end_time is not None:
-                existing_start = (event.get("start", {}) or {}).get("dateTime")
-                existing_end = (event.get("end", {}) or {}).get("dateTime")
+                existing_start = (event.get("start") or _EMPTY).get("dateTime")
+                existing_end = (event.get("end") or _EMPTY).get("dateTime")
                 final_start = start_time or existing_start
                 final_end = end_time or existing_end
 
@@ -497,8 +517,8 @@ class CalendarTools:
                 final_timezone = timezone_name
                 if not final_timezone:
                     final_timezone = (
-                        (event.get("start", {}) or {}).get("timeZone")
-                        or (event.get("end", {}) or {}).get("timeZone")
+                        (event.get("start") or _EMPTY).get("timeZone")
+                        or (event.get("end") or _EMPTY).get("timeZone")
                         or "UTC"
                     )
 
@@ -506,9 +526,9 @@ class CalendarTools:
                 event["end"] = {"dateTime": final_end, "timeZone": final_timezone}
             elif timezone_name:
                 # If only timezone is changed, apply to existing dateTime values where present.
-                if (event.get("start", {}) or {}).get("dateTime"):
+                if (event.get("start") or _EMPTY).get("dateTime"):
                     event["start"]["timeZone"] = timezone_name
-                if (event.get("end", {}) or {}).get("dateTime"):
+                if (event.get("end") or _EMPTY).get("dateTime"):
                     event["end"]["timeZone"] = timezone_name
 
             if attendees is not None:
@@ -527,8 +547,8 @@ class CalendarTools:
                 "calendar_id": calendar_id,
                 "summary": updated.get("summary", ""),
                 "html_link": updated.get("htmlLink", ""),
-                "start": (updated.get("start", {}) or {}).get("dateTime"),
-                "end": (updated.get("end", {}) or {}).get("dateTime"),
+                "start": (updated.get("start") or _EMPTY).get("dateTime"),
+                "end": (updated.get("end") or _EMPTY).get("dateTime"),
             }
 
         except HttpError as e:
@@ -550,4 +570,59 @@ class CalendarTools:
             }
         except HttpError as e:
             logger.error("calendar_delete_error", error=str(e), event_id=event_id)
-            return {"error": f"Calendar API error: {str(e)}"}
\ No newline at end of file
+            return {"error": f"Calendar API error: {str(e)}"}
+
+    async def delete_events(
+        self, event_ids: list[str], calendar_id: str = "primary"
+    ) -> dict[str, Any]:
+        """Delete several events in one batched Google Calendar API request."""
+        try:
+            if not self.service:
+                return {"error": "Calendar service not initialized"}
+
+            ids = [event_id for event_id in dict.fromkeys(event_ids) if event_id]
+            if not ids:
+                return {"error": "At least one event_id is required"}
+
+            deleted: list[str] = []
+            failed: list[dict[str, str]] = []
+
+            def _on_response(request_id: str, _response: Any, exception: Exception | None) -> None:
+                if exception is None:
+                    deleted.append(request_id)
+                else:
+                    failed.append({"event_id": request_id, "error": str(exception)})
+
+            events = self.service.events()
+            for start in range(0, len(ids), _BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=_on_response)
+                for event_id in ids[start:start + _BATCH_LIMIT]:
+                    batch.add(
+                        events.delete(calendarId=calendar_id, eventId=event_id),
+                        request_id=event_id,
+                    )
+                batch.execute()
+
+            logger.info(
+                "calendar_events_deleted",
+                deleted=len(deleted),
+                failed=len(failed),
+                calendar_id=calendar_id,
+            )
+            if not deleted:
+                return {
+                    "status": "failed",
+                    "error": "No events were deleted",
+                    "deleted": deleted,
+                    "failed": failed,
+                    "calendar_id": calendar_id,
+                }
+            return {
+                "status": "deleted" if not failed else "partial",
+                "deleted": deleted,
+                "failed": failed,
+                "calendar_id": calendar_id,
+            }
+        except HttpError as e:
+            logger.error("calendar_delete_error", error=str(e), event_ids=event_ids)
+            return {"error": f"Calendar API error: {str(e)}"}
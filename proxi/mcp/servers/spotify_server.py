@@ -4,6 +4,7 @@
 import asyncio
 import json
 import sys
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from proxi.observability.logging import get_logger
@@ -219,6 +220,184 @@ SPOTIFY_TOOLS = [
 ]
 
 
+def _missing(field: str) -> dict[str, Any]:
+    return {"error": f"Missing required field: '{field}'"}
+
+
+async def _device_id(spotify: Any, arguments: dict[str, Any]) -> str | None:
+    """Return the explicit device_id, or resolve one from device_name."""
+    device_id = arguments.get("device_id")
+    device_name = arguments.get("device_name")
+    if not device_id and device_name:
+        device_id = await spotify.resolve_device_id(device_name=device_name)
+    return device_id
+
+
+async def _get_profile(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.get_profile()
+
+
+async def _get_playback(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.get_current_playback()
+
+
+async def _list_devices(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.list_devices()
+
+
+async def _get_current_track(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.get_current_track_uri()
+
+
+async def _play(spotify: Any, arguments: dict[str, Any]) -> Any:
+    uris = arguments.get("uris") or arguments.get("track_uris")
+    if uris is None and arguments.get("track_uri"):
+        uris = [arguments.get("track_uri")]
+    return await spotify.play(
+        context_uri=arguments.get("context_uri"),
+        uris=uris,
+        device_id=await _device_id(spotify, arguments),
+    )
+
+
+async def _pause(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.pause(device_id=await _device_id(spotify, arguments))
+
+
+async def _next_track(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.next_track(device_id=await _device_id(spotify, arguments))
+
+
+async def _previous_track(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.previous_track(device_id=await _device_id(spotify, arguments))
+
+
+async def _set_volume(spotify: Any, arguments: dict[str, Any]) -> Any:
+    if "volume_percent" not in arguments:
+        return _missing("volume_percent")
+    device_id = await _device_id(spotify, arguments)
+    return await spotify.set_volume(
+        volume_percent=int(arguments["volume_percent"]),
+        device_id=device_id,
+    )
+
+
+async def _search(spotify: Any, arguments: dict[str, Any]) -> Any:
+    query = arguments.get("query") or ""
+    if not query.strip():
+        return _missing("query")
+    return await spotify.search(
+        query=query,
+        search_type=arguments.get("search_type", "track"),
+        limit=int(arguments.get("limit", arguments.get("max_results", 10))),
+    )
+
+
+async def _list_playlists(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.list_playlists(limit=int(arguments.get("limit", 20)))
+
+
+async def _get_playlist(spotify: Any, arguments: dict[str, Any]) -> Any:
+    playlist_id = (arguments.get("playlist_id") or "").strip()
+    if not playlist_id:
+        return _missing("playlist_id")
+    return await spotify.get_playlist(
+        playlist_id,
+        include_tracks=bool(arguments.get("include_tracks", False)),
+    )
+
+
+async def _create_playlist(spotify: Any, arguments: dict[str, Any]) -> Any:
+    playlist_name = (arguments.get("name") or "").strip()
+    if not playlist_name:
+        return _missing("name")
+    return await spotify.create_playlist(
+        name=playlist_name,
+        public=bool(arguments.get("public", False)),
+        description=arguments.get("description"),
+    )
+
+
+async def _play_playlist(spotify: Any, arguments: dict[str, Any]) -> Any:
+    playlist_id = (arguments.get("playlist_id") or "").strip()
+    if not playlist_id:
+        return _missing("playlist_id")
+    return await spotify.play_playlist(
+        playlist_id=playlist_id,
+        device_id=arguments.get("device_id"),
+    )
+
+
+async def _add_track_to_playlist(spotify: Any, arguments: dict[str, Any]) -> Any:
+    playlist_id = (arguments.get("playlist_id") or "").strip()
+    track_uri = (arguments.get("track_uri") or "").strip()
+    if not playlist_id:
+        return _missing("playlist_id")
+    if not track_uri:
+        return _missing("track_uri")
+    return await spotify.add_track_to_playlist(
+        playlist_id=playlist_id,
+        track_uri=track_uri,
+    )
+
+
+async def _add_current_track_to_playlist(spotify: Any, arguments: dict[str, Any]) -> Any:
+    playlist_id = (arguments.get("playlist_id") or "").strip()
+    if not playlist_id:
+        return _missing("playlist_id")
+    return await spotify.add_current_track_to_playlist(playlist_id=playlist_id)
+
+
+async def _queue_add(spotify: Any, arguments: dict[str, Any]) -> Any:
+    item_uri = (
+        arguments.get("item_uri")
+        or arguments.get("track_uri")
+        or arguments.get("uri")
+        or ""
+    ).strip()
+    if not item_uri:
+        return _missing("item_uri")
+    device_id = await _device_id(spotify, arguments)
+    return await spotify.add_to_queue(item_uri=item_uri, device_id=device_id)
+
+
+async def _queue_next(spotify: Any, arguments: dict[str, Any]) -> Any:
+    result = await spotify.get_queue()
+    return {
+        "next": result.get("next"),
+        "currently_playing": result.get("currently_playing"),
+        "count": result.get("count", 0),
+    }
+
+
+async def _list_queue(spotify: Any, arguments: dict[str, Any]) -> Any:
+    return await spotify.get_queue()
+
+
+# Tool name -> handler. Each handler returns the JSON-serialisable tool result.
+_TOOL_HANDLERS: dict[str, Callable[[Any, dict[str, Any]], Awaitable[Any]]] = {
+    "spotify_get_profile": _get_profile,
+    "spotify_get_playback": _get_playback,
+    "spotify_list_devices": _list_devices,
+    "spotify_get_current_track": _get_current_track,
+    "spotify_play": _play,
+    "spotify_pause": _pause,
+    "spotify_next_track": _next_track,
+    "spotify_previous_track": _previous_track,
+    "spotify_set_volume": _set_volume,
+    "spotify_search": _search,
+    "spotify_list_playlists": _list_playlists,
+    "spotify_get_playlist": _get_playlist,
+    "spotify_create_playlist": _create_playlist,
+    "spotify_play_playlist": _play_playlist,
+    "spotify_add_track_to_playlist": _add_track_to_playlist,
+    "spotify_add_current_track_to_playlist": _add_current_track_to_playlist,
+    "spotify_queue_add": _queue_add,
+    "spotify_queue_next": _queue_next,
+    "spotify_list_queue": _list_queue,
+}
+
+
 class SpotifyMCPServer:
     """Standalone MCP server for Spotify operations."""
 
@@ -244,173 +423,11 @@ class SpotifyMCPServer:
     async def handle_call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         try:
             spotify = self._get_spotify()
-
-            if name == "spotify_get_profile":
-                result = await spotify.get_profile()
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_get_playback":
-                result = await spotify.get_current_playback()
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_list_devices":
-                result = await spotify.list_devices()
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_get_current_track":
-                result = await spotify.get_current_track_uri()
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_play":
-                uris = arguments.get("uris") or arguments.get("track_uris")
-                if uris is None and arguments.get("track_uri"):
-                    uris = [arguments.get("track_uri")]
-
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-
-                result = await spotify.play(
-                    context_uri=arguments.get("context_uri"),
-                    uris=uris,
-                    device_id=device_id,
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_pause":
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-                result = await spotify.pause(device_id=device_id)
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_next_track":
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-                result = await spotify.next_track(device_id=device_id)
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_previous_track":
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-                result = await spotify.previous_track(device_id=device_id)
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_set_volume":
-                if "volume_percent" not in arguments:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'volume_percent'"})}]}
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-                result = await spotify.set_volume(
-                    volume_percent=int(arguments["volume_percent"]),
-                    device_id=device_id,
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_search":
-                query = arguments.get("query") or ""
-                if not query.strip():
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'query'"})}]}
-                result = await spotify.search(
-                    query=query,
-                    search_type=arguments.get("search_type", "track"),
-                    limit=int(arguments.get("limit", arguments.get("max_results", 10))),
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_list_playlists":
-                result = await spotify.list_playlists(limit=int(arguments.get("limit", 20)))
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_get_playlist":
-                playlist_id = (arguments.get("playlist_id") or "").strip()
-                if not playlist_id:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'playlist_id'"})}]}
-                result = await spotify.get_playlist(
-                    playlist_id,
-                    include_tracks=bool(arguments.get("include_tracks", False)),
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_create_playlist":
-                playlist_name = (arguments.get("name") or "").strip()
-                if not playlist_name:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'name'"})}]}
-                result = await spotify.create_playlist(
-                    name=playlist_name,
-                    public=bool(arguments.get("public", False)),
-                    description=arguments.get("description"),
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_play_playlist":
-                playlist_id = (arguments.get("playlist_id") or "").strip()
-                if not playlist_id:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'playlist_id'"})}]}
-                result = await spotify.play_playlist(
-                    playlist_id=playlist_id,
-                    device_id=arguments.get("device_id"),
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_add_track_to_playlist":
-                playlist_id = (arguments.get("playlist_id") or "").strip()
-                track_uri = (arguments.get("track_uri") or "").strip()
-                if not playlist_id:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'playlist_id'"})}]}
-                if not track_uri:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'track_uri'"})}]}
-                result = await spotify.add_track_to_playlist(
-                    playlist_id=playlist_id,
-                    track_uri=track_uri,
-                )
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_add_current_track_to_playlist":
-                playlist_id = (arguments.get("playlist_id") or "").strip()
-                if not playlist_id:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'playlist_id'"})}]}
-                result = await spotify.add_current_track_to_playlist(playlist_id=playlist_id)
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_queue_add":
-                item_uri = (
-                    arguments.get("item_uri")
-                    or arguments.get("track_uri")
-                    or arguments.get("uri")
-                    or ""
-                ).strip()
-                if not item_uri:
-                    return {"content": [{"type": "text", "text": json.dumps({"error": "Missing required field: 'item_uri'"})}]}
-                device_id = arguments.get("device_id")
-                device_name = arguments.get("device_name")
-                if not device_id and device_name:
-                    device_id = await spotify.resolve_device_id(device_name=device_name)
-                result = await spotify.add_to_queue(item_uri=item_uri, device_id=device_id)
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            if name == "spotify_queue_next":
-                result = await spotify.get_queue()
-                payload = {
-                    "next": result.get("next"),
-                    "currently_playing": result.get("currently_playing"),
-                    "count": result.get("count", 0),
-                }
-                return {"content": [{"type": "text", "text": json.dumps(payload)}]}
-
-            if name == "spotify_list_queue":
-                result = await spotify.get_queue()
-                return {"content": [{"type": "text", "text": json.dumps(result)}]}
-
-            return {"content": [{"type": "text", "text": f"Unknown tool: {name}"}], "isError": True}
+            handler = _TOOL_HANDLERS.get(name)
+            if handler is None:
+                return {"content": [{"type": "text", "text": f"Unknown tool: {name}"}], "isError": True}
+            result = await handler(spotify, arguments)
+            return {"content": [{"type": "text", "text": json.dumps(result)}]}
 
         except Exception as e:
             logger.error("spotify_tool_error", tool=name, error=str(e))
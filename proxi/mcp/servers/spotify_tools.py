@@ -7,6 +7,7 @@ import base64
 import json
 import os
 import secrets
+import threading
 import time
 import webbrowser
 from dataclasses import dataclass
@@ -67,20 +68,33 @@ class SpotifyTools:
                 "Spotify credentials are missing. Set SPOTIFY_CLIENT_ID and "
                 "SPOTIFY_CLIENT_SECRET in your environment."
             )
+        # Requests run on worker threads; only one may refresh or re-authorize.
+        self._auth_lock = threading.Lock()
+        # (mtime_ns, parsed token file) so per-request token checks skip the disk.
+        self._token_cache: tuple[int, dict[str, Any]] | None = None
+        # /me payload for the authorized account; cleared when OAuth re-runs.
+        self._me: dict[str, Any] | None = None
 
     def _basic_auth_header(self) -> str:
         payload = f"{self.client_id}:{self.client_secret}".encode("utf-8")
         return "Basic " + base64.b64encode(payload).decode("utf-8")
 
     def _load_token(self) -> dict[str, Any] | None:
-        if not self.token_path.exists():
+        # Every API call checks the token; re-parse only when the file changes.
+        try:
+            mtime_ns = self.token_path.stat().st_mtime_ns
+        except OSError:
             return None
+        if self._token_cache is not None and self._token_cache[0] == mtime_ns:
+            return self._token_cache[1]
         try:
             with self.token_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+                token_data = json.load(f)
         except Exception as exc:
             logger.warning("spotify_token_load_error", error=str(exc))
             return None
+        self._token_cache = (mtime_ns, token_data)
+        return token_data
 
     def _save_token(self, token_data: dict[str, Any]) -> None:
         token_data = dict(token_data)
@@ -89,6 +103,7 @@ class SpotifyTools:
         self.token_path.parent.mkdir(parents=True, exist_ok=True)
         with self.token_path.open("w", encoding="utf-8") as f:
             json.dump(token_data, f)
+        self._token_cache = (self.token_path.stat().st_mtime_ns, token_data)
 
     @staticmethod
     def _token_scopes(token_data: dict[str, Any] | None) -> set[str]:
@@ -136,6 +151,8 @@ class SpotifyTools:
                 "http://127.0.0.1:8888/callback"
             )
 
+        # Re-authorizing may switch accounts.
+        self._me = None
         result = _OAuthResult()
         expected_state = secrets.token_urlsafe(20)
 
@@ -229,7 +246,26 @@ class SpotifyTools:
             raise RuntimeError("Spotify token exchange did not return an access token")
         return str(access_token)
 
-    def _spotify_request(
+    async def _spotify_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+        expected_statuses: set[int] | None = None,
+    ) -> requests.Response:
+        """Run a blocking Spotify API call on a worker thread."""
+        return await asyncio.to_thread(
+            self._spotify_request_sync,
+            method,
+            endpoint,
+            params=params,
+            json_body=json_body,
+            expected_statuses=expected_statuses,
+        )
+
+    def _spotify_request_sync(
         self,
         method: str,
         endpoint: str,
@@ -242,7 +278,8 @@ class SpotifyTools:
 
         # Single retry path to recover from expired/missing-scope tokens.
         for attempt in range(2):
-            token = self._ensure_access_token()
+            with self._auth_lock:
+                token = self._ensure_access_token()
             response = requests.request(
                 method=method,
                 url=url,
@@ -260,8 +297,14 @@ class SpotifyTools:
                     body = {}
                 message = str(((body.get("error") or {}).get("message") or "")).lower()
                 if "scope" in message or "token" in message or response.status_code == 401:
-                    logger.warning("spotify_auth_retry_reauthorize", status=response.status_code)
-                    self._run_oauth_flow()
+                    with self._auth_lock:
+                        # A concurrent request may already have re-authorized.
+                        current = self._load_token() or {}
+                        if current.get("access_token") == token:
+                            logger.warning(
+                                "spotify_auth_retry_reauthorize", status=response.status_code
+                            )
+                            self._run_oauth_flow()
                     continue
 
             break
@@ -308,9 +351,15 @@ class SpotifyTools:
 
         return response
 
+    async def _current_user(self) -> dict[str, Any]:
+        """Return the connected account's /me payload, fetched once per instance."""
+        if self._me is None:
+            self._me = (await self._spotify_request("GET", "/me")).json()
+        return self._me
+
     async def get_current_track_uri(self) -> dict[str, Any]:
         """Get the currently playing track URI, if any."""
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "GET",
             "/me/player/currently-playing",
             expected_statuses={200, 204},
@@ -332,7 +381,7 @@ class SpotifyTools:
         if device_id:
             params["device_id"] = device_id
 
-        self._spotify_request(
+        await self._spotify_request(
             "POST",
             "/me/player/queue",
             params=params,
@@ -347,7 +396,7 @@ class SpotifyTools:
 
     async def get_queue(self) -> dict[str, Any]:
         """Return the user's current queue."""
-        response = self._spotify_request("GET", "/me/player/queue")
+        response = await self._spotify_request("GET", "/me/player/queue")
         payload = response.json()
 
         def _simplify(item: dict[str, Any] | None) -> dict[str, Any] | None:
@@ -372,7 +421,7 @@ class SpotifyTools:
 
     async def list_devices(self) -> dict[str, Any]:
         """List available Spotify playback devices for the connected account."""
-        response = self._spotify_request("GET", "/me/player/devices")
+        response = await self._spotify_request("GET", "/me/player/devices")
         items = response.json().get("devices", [])
         devices = [
             {
@@ -389,7 +438,7 @@ class SpotifyTools:
 
     async def resolve_device_id(self, device_name: str | None = None) -> str | None:
         """Resolve a device name to a Spotify device_id, or return active device if omitted."""
-        response = self._spotify_request("GET", "/me/player/devices")
+        response = await self._spotify_request("GET", "/me/player/devices")
         devices = response.json().get("devices", [])
 
         if not devices:
@@ -410,7 +459,7 @@ class SpotifyTools:
 
     async def get_current_playback(self) -> dict[str, Any]:
         """Get current playback state and track details."""
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "GET",
             "/me/player",
             expected_statuses={200, 204},
@@ -451,7 +500,7 @@ class SpotifyTools:
 
         if device_id:
             # Transfer first to reduce false-success responses where play targets another device.
-            self._spotify_request(
+            await self._spotify_request(
                 "PUT",
                 "/me/player",
                 json_body={"device_ids": [device_id], "play": False},
@@ -459,7 +508,7 @@ class SpotifyTools:
             )
 
         params = {"device_id": device_id} if device_id else None
-        self._spotify_request(
+        await self._spotify_request(
             "PUT",
             "/me/player/play",
             params=params,
@@ -517,7 +566,7 @@ class SpotifyTools:
     async def pause(self, device_id: str | None = None) -> dict[str, Any]:
         """Pause current playback."""
         params = {"device_id": device_id} if device_id else None
-        self._spotify_request(
+        await self._spotify_request(
             "PUT",
             "/me/player/pause",
             params=params,
@@ -528,7 +577,7 @@ class SpotifyTools:
     async def next_track(self, device_id: str | None = None) -> dict[str, Any]:
         """Skip to the next track."""
         params = {"device_id": device_id} if device_id else None
-        self._spotify_request(
+        await self._spotify_request(
             "POST",
             "/me/player/next",
             params=params,
@@ -539,7 +588,7 @@ class SpotifyTools:
     async def previous_track(self, device_id: str | None = None) -> dict[str, Any]:
         """Skip to the previous track."""
         params = {"device_id": device_id} if device_id else None
-        self._spotify_request(
+        await self._spotify_request(
             "POST",
             "/me/player/previous",
             params=params,
@@ -555,7 +604,7 @@ class SpotifyTools:
         params: dict[str, Any] = {"volume_percent": volume_percent}
         if device_id:
             params["device_id"] = device_id
-        self._spotify_request(
+        await self._spotify_request(
             "PUT",
             "/me/player/volume",
             params=params,
@@ -569,7 +618,7 @@ class SpotifyTools:
         if search_type not in allowed_types:
             return {"error": f"search_type must be one of: {sorted(allowed_types)}"}
 
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "GET",
             "/search",
             params={
@@ -623,7 +672,7 @@ class SpotifyTools:
 
     async def list_playlists(self, limit: int = 20) -> dict[str, Any]:
         """List playlists from the connected Spotify account."""
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "GET",
             "/me/playlists",
             params={"limit": max(1, min(limit, 50))},
@@ -652,7 +701,7 @@ class SpotifyTools:
                 )
             }
 
-        response = self._spotify_request("GET", f"/playlists/{playlist_id}", params=params)
+        response = await self._spotify_request("GET", f"/playlists/{playlist_id}", params=params)
         payload = response.json()
         owner = payload.get("owner") or {}
         tracks = payload.get("tracks") or {}
@@ -693,12 +742,12 @@ class SpotifyTools:
         description: str | None = None,
     ) -> dict[str, Any]:
         """Create a playlist under the connected Spotify account."""
-        me = self._spotify_request("GET", "/me").json()
+        me = await self._current_user()
         user_id = me.get("id")
         if not user_id:
             return {"error": "Could not resolve Spotify user id"}
 
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "POST",
             f"/users/{user_id}/playlists",
             json_body={
@@ -741,8 +790,11 @@ class SpotifyTools:
 
     async def add_track_to_playlist(self, playlist_id: str, track_uri: str) -> dict[str, Any]:
         """Add a track URI to a playlist."""
-        me = self._spotify_request("GET", "/me").json()
-        playlist = await self.get_playlist(playlist_id, include_tracks=False)
+        # Independent lookups: fetch the account and playlist concurrently.
+        me, playlist = await asyncio.gather(
+            self._current_user(),
+            self.get_playlist(playlist_id, include_tracks=False),
+        )
         owner_id = ((playlist.get("owner") or {}).get("id"))
         collaborative = bool(playlist.get("collaborative"))
 
@@ -760,7 +812,7 @@ class SpotifyTools:
                 },
             }
 
-        response = self._spotify_request(
+        response = await self._spotify_request(
             "POST",
             f"/playlists/{playlist_id}/tracks",
             json_body={"uris": [track_uri]},
@@ -777,8 +829,8 @@ class SpotifyTools:
 
     async def get_profile(self) -> dict[str, Any]:
         """Get the profile for the connected Spotify account."""
-        response = self._spotify_request("GET", "/me")
-        payload = response.json()
+        response = await self._spotify_request("GET", "/me")
+        payload = self._me = response.json()
         return {
             "id": payload.get("id"),
             "display_name": payload.get("display_name"),
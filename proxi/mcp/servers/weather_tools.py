@@ -2,48 +2,157 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import hashlib
 import json
+import os
+import tempfile
+import time
+from pathlib import Path
 from urllib.parse import urlencode
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
 from proxi.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Forecasts change hourly at most; a short TTL lets back-to-back tool calls
+# for the same place share one request without serving stale data.
+_FORECAST_TTL_SECONDS = 300.0
+# Place coordinates rarely change, but a bad first hit should not stick forever.
+_GEOCODE_TTL_SECONDS = 30 * 24 * 3600.0
+# Per-cache entry caps; the least recently written entries are evicted first.
+_GEOCODE_MAX_ENTRIES = 512
+_FORECAST_MAX_ENTRIES = 128
+
+
+def _cache_dir() -> Path:
+    """Directory for weather lookups persisted across CLI invocations."""
+    home = Path(os.environ.get("PROXI_HOME", str(Path.home() / ".proxi"))).expanduser()
+    return home / "cache" / "weather"
+
+
+def _normalize_query(location: str) -> str:
+    """Collapse case and whitespace so equivalent place names share a cache key."""
+    return " ".join(location.split()).casefold()
+
+
+class _DiskCache:
+    """JSON cache stored as one file per key under ``_cache_dir() / name``.
+
+    Each weather tool call runs in a fresh process and calls may overlap, so
+    no file is ever read-modified-written: a key's entry is written to a
+    unique temp file and atomically swapped into place.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self._name = name
+        self._ttl = ttl
+        self._max_entries = max_entries
+
+    @property
+    def directory(self) -> Path:
+        return _cache_dir() / self._name
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: dict) -> None:
+        """Store a value; a failed write only costs a future lookup."""
+        entry = {
+            "key": key,
+            "value": value,
+            "expires_at": time.time() + self._ttl if self._ttl is not None else None,
+        }
+        # Failures are deliberately not logged: this runs inside CLI scripts
+        # whose stdout must stay a single JSON object.
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(entry, fh)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp)
+                raise
+            self._evict()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Drop the oldest entries beyond ``max_entries``; runs only after a miss."""
+        if self._max_entries is None:
+            return
+        entries = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                entries.append((path.stat().st_mtime_ns, path))
+        if len(entries) <= self._max_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self._max_entries]:
+            # Another process may have evicted the same file already.
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+# Open-Meteo WMO weather codes -> short descriptions.
+_WEATHER_DESCRIPTIONS: dict[int, str] = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Fog",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    56: "Light freezing drizzle",
+    57: "Dense freezing drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    66: "Light freezing rain",
+    67: "Heavy freezing rain",
+    71: "Slight snow fall",
+    73: "Moderate snow fall",
+    75: "Heavy snow fall",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail",
+}
+
 
 def _weather_description(code: int) -> str:
     """Map Open-Meteo weather codes to short descriptions."""
-    descriptions = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Fog",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        56: "Light freezing drizzle",
-        57: "Dense freezing drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        66: "Light freezing rain",
-        67: "Heavy freezing rain",
-        71: "Slight snow fall",
-        73: "Moderate snow fall",
-        75: "Heavy snow fall",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-    }
-    return descriptions.get(code, "Unknown")
+    return _WEATHER_DESCRIPTIONS.get(code, "Unknown")
 
 
 class WeatherTools:
@@ -52,12 +161,35 @@ class WeatherTools:
     GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
     FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 
+    def __init__(self) -> None:
+        self._geocode_cache = _DiskCache(
+            "geocode", ttl=_GEOCODE_TTL_SECONDS, max_entries=_GEOCODE_MAX_ENTRIES
+        )
+        self._forecast_cache = _DiskCache(
+            "forecast", ttl=_FORECAST_TTL_SECONDS, max_entries=_FORECAST_MAX_ENTRIES
+        )
+
     def _http_get_json(self, base_url: str, params: dict[str, str | int]) -> dict:
         """Execute a GET request and parse JSON response."""
         url = f"{base_url}?{urlencode(params)}"
-        with urlopen(url, timeout=15) as response:  # nosec B310
-            payload = response.read().decode("utf-8")
-        return json.loads(payload)
+        # urllib does not negotiate compression on its own; Open-Meteo gzips
+        # JSON bodies when asked.
+        request = Request(url, headers={"Accept-Encoding": "gzip"})
+        with urlopen(request, timeout=15) as response:  # nosec B310
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+        return json.loads(body)
+
+    def _get_forecast_json(self, params: dict[str, str | int]) -> dict:
+        """Fetch forecast data, reusing a recent response for identical params."""
+        key = json.dumps(params, sort_keys=True)
+        cached = self._forecast_cache.get(key)
+        if cached is not None:
+            return cached
+        data = self._http_get_json(self.FORECAST_URL, params)
+        self._forecast_cache.set(key, data)
+        return data
 
     def _resolve_location(self, location: str) -> dict:
         """Resolve a location name to coordinates and place metadata."""
@@ -65,6 +197,11 @@ class WeatherTools:
         if not location_name:
             raise ValueError("location cannot be empty")
 
+        key = _normalize_query(location_name)
+        cached = self._geocode_cache.get(key)
+        if cached is not None:
+            return cached
+
         data = self._http_get_json(
             self.GEOCODING_URL,
             {
@@ -77,7 +214,9 @@ class WeatherTools:
         results = data.get("results", [])
         if not results:
             raise ValueError(f"No location found for '{location_name}'")
-        return results[0]
+        place = results[0]
+        self._geocode_cache.set(key, place)
+        return place
 
     async def get_current_weather(self, location: str, unit: str = "celsius") -> dict:
         """Get current weather for a location name."""
@@ -87,8 +226,7 @@ class WeatherTools:
                 return {"error": "unit must be either 'celsius' or 'fahrenheit'"}
 
             place = self._resolve_location(location)
-            forecast = self._http_get_json(
-                self.FORECAST_URL,
+            forecast = self._get_forecast_json(
                 {
                     "latitude": place["latitude"],
                     "longitude": place["longitude"],
@@ -138,8 +276,7 @@ class WeatherTools:
             forecast_days = max(1, min(int(days), 7))
 
             place = self._resolve_location(location)
-            forecast = self._http_get_json(
-                self.FORECAST_URL,
+            forecast = self._get_forecast_json(
                 {
                     "latitude": place["latitude"],
                     "longitude": place["longitude"],
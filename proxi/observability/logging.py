@@ -4,8 +4,11 @@ import atexit
 import json
 import logging
 import os
+import queue
 import random
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Union
@@ -39,6 +42,21 @@ _EVENT_CATEGORY_MAP = {
 }
 
 
+# (epoch second, rendered "%Y-%m-%d %H:%M:%S") for the console renderers
+_last_ts: tuple[int, str] = (-1, "")
+
+
+def _console_timestamp() -> str:
+    """Return the local wall-clock second, re-formatting only when it changes."""
+    global _last_ts
+    second = int(time.time())
+    cached_second, cached = _last_ts
+    if second != cached_second:
+        cached = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _last_ts = (second, cached)
+    return cached
+
+
 def _event_category_processor(logger: logging.Logger, method_name: str, event_dict: dict) -> dict:
     """Add _event_category and _event_color from event name for colored output."""
     event = event_dict.get("event", "")
@@ -63,7 +81,7 @@ def _colored_console_renderer(logger: logging.Logger, method_name: str, event_di
                    if k not in ("_event_category", "_event_color", "_level", "event", "level")}
 
     # Get current timestamp
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    ts = _console_timestamp()
     
     # Build: [timestamp] [event] [level]
     event_tag = ""
@@ -94,7 +112,7 @@ def _plain_console_renderer(logger: logging.Logger, method_name: str, event_dict
                    if k not in ("_event_category", "_event_color", "_level", "event", "level")}
     
     # Get current timestamp
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    ts = _console_timestamp()
     
     # Build: [timestamp] [event] [level]
     event_tag = ""
@@ -112,6 +130,55 @@ def _plain_console_renderer(logger: logging.Logger, method_name: str, event_dict
     return prefix + (" " + line if line else "")
 
 
+class _BackgroundFileWriter:
+    """Append rendered log lines from a daemon thread.
+
+    Log calls only enqueue; the file write and flush happen off the caller's
+    thread (usually the event loop). Flushes are coalesced: the writer flushes
+    once the queue is drained rather than after every line.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        self._handle = open(file_path, "a", encoding="utf-8")
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="proxi-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, line: str) -> None:
+        self._queue.put(line)
+
+    def close(self) -> None:
+        """Write out everything queued so far, then close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            if line is None:
+                break
+            try:
+                self._handle.write(line)
+                if self._queue.empty():
+                    self._handle.flush()
+            except Exception:
+                pass
+        try:
+            self._handle.close()
+        except Exception:
+            pass
+
+
+# Writer owned by the current setup_logging() configuration, closed on reconfigure.
+_active_file_writer: _BackgroundFileWriter | None = None
+
+
 def setup_logging(
     level: str = "INFO",
     use_colors: bool = True,
@@ -123,6 +190,11 @@ def setup_logging(
     - Console output (stdout) will have ANSI colors
     - File output will be plain text without ANSI codes
     """
+    global _active_file_writer
+    if _active_file_writer is not None:
+        _active_file_writer.close()
+        _active_file_writer = None
+
     # Configure base logging
     logging.basicConfig(
         format="%(message)s",
@@ -206,29 +278,20 @@ def setup_logging(
         class FileOutputProcessor:
             """Logs output to file without ANSI codes."""
             
-            def __init__(self, file_path: Path):
-                self.file_path = file_path
-                self.file_handle = open(file_path, "a", encoding="utf-8")
-                atexit.register(self._cleanup)
-            
-            def _cleanup(self) -> None:
-                try:
-                    self.file_handle.close()
-                except Exception:
-                    pass
+            def __init__(self, writer: _BackgroundFileWriter):
+                self._writer = writer
             
             def __call__(self, logger: logging.Logger, method_name: str, event_dict: dict) -> dict:
-                # Render using the same plain renderer
+                # Render here, while event_dict is still this call's snapshot;
+                # only the disk write is handed to the background thread.
                 message = _plain_console_renderer(logger, method_name, event_dict)
-                
-                # Write to file
-                self.file_handle.write(message + "\n")
-                self.file_handle.flush()
+                self._writer.write(message + "\n")
                 
                 # Return the event_dict unchanged so it gets rendered to console
                 return event_dict
         
-        file_processor = FileOutputProcessor(path)
+        _active_file_writer = _BackgroundFileWriter(path)
+        file_processor = FileOutputProcessor(_active_file_writer)
         processors = [
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
@@ -16,6 +16,71 @@ import json
 import socket
 import sys
 import urllib.error
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+_Result = Coroutine[Any, Any, dict[str, Any]]
+
+
+def _list_events(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.list_events(
+        max_results=args.max_results,
+        calendar_id=args.calendar_id,
+        time_min=args.time_min,
+        time_max=args.time_max,
+        query=args.query,
+    )
+
+
+def _create_event(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.create_event(
+        summary=args.summary,
+        start_time=args.start_time,
+        end_time=args.end_time,
+        timezone_name=args.timezone,
+        calendar_id=args.calendar_id,
+        attendees=args.attendees,
+        description=args.description,
+        location=args.location,
+    )
+
+
+def _update_event(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.update_event(
+        event_id=args.event_id,
+        calendar_id=args.calendar_id,
+        summary=args.summary,
+        start_time=args.start_time,
+        end_time=args.end_time,
+        timezone_name=args.timezone,
+        attendees=args.attendees,
+        description=args.description,
+        location=args.location,
+    )
+
+
+def _get_event(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.get_event(args.event_id, args.calendar_id)
+
+
+def _delete_event(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.delete_event(args.event_id, args.calendar_id)
+
+
+def _delete_events(tools: Any, args: argparse.Namespace) -> _Result:
+    return tools.delete_events(args.event_ids, args.calendar_id)
+
+
+# Subcommand -> coroutine factory. argparse already validates each
+# subcommand's arguments, so dispatch is a single lookup.
+_HANDLERS: dict[str, Callable[[Any, argparse.Namespace], _Result]] = {
+    "list-events": _list_events,
+    "create-event": _create_event,
+    "get-event": _get_event,
+    "update-event": _update_event,
+    "delete-event": _delete_event,
+    "delete-events": _delete_events,
+}
 
 
 def main() -> None:
@@ -61,6 +126,14 @@ def main() -> None:
     delete.add_argument("--event-id", required=True, help="Event ID")
     delete.add_argument("--calendar-id", default="primary", help="Calendar ID")
 
+    delete_many = sub.add_parser(
+        "delete-events", help="Delete several events in one request", allow_abbrev=False
+    )
+    delete_many.add_argument(
+        "--event-ids", action="append", required=True, help="Event ID (repeatable)"
+    )
+    delete_many.add_argument("--calendar-id", default="primary", help="Calendar ID")
+
     args = parser.parse_args()
 
     try:
@@ -68,47 +141,7 @@ def main() -> None:
 
         tools = CalendarTools()
 
-        if args.cmd == "list-events":
-            result = asyncio.run(
-                tools.list_events(
-                    max_results=args.max_results,
-                    calendar_id=args.calendar_id,
-                    time_min=args.time_min,
-                    time_max=args.time_max,
-                    query=args.query,
-                )
-            )
-        elif args.cmd == "create-event":
-            result = asyncio.run(
-                tools.create_event(
-                    summary=args.summary,
-                    start_time=args.start_time,
-                    end_time=args.end_time,
-                    timezone_name=args.timezone,
-                    calendar_id=args.calendar_id,
-                    attendees=args.attendees,
-                    description=args.description,
-                    location=args.location,
-                )
-            )
-        elif args.cmd == "get-event":
-            result = asyncio.run(tools.get_event(args.event_id, args.calendar_id))
-        elif args.cmd == "update-event":
-            result = asyncio.run(
-                tools.update_event(
-                    event_id=args.event_id,
-                    calendar_id=args.calendar_id,
-                    summary=args.summary,
-                    start_time=args.start_time,
-                    end_time=args.end_time,
-                    timezone_name=args.timezone,
-                    attendees=args.attendees,
-                    description=args.description,
-                    location=args.location,
-                )
-            )
-        else:
-            result = asyncio.run(tools.delete_event(args.event_id, args.calendar_id))
+        result = asyncio.run(_HANDLERS[args.cmd](tools, args))
 
         print(json.dumps(result))
         sys.exit(0)
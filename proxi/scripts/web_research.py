@@ -230,15 +230,36 @@ def main() -> None:
     workers = depth_to_workers[args.depth]
 
     try:
+        # Query variants are independent searches; run them concurrently so the
+        # wall-clock cost is bounded by the slowest batch rather than their sum.
+        # Concurrency is capped at ``workers`` to stay under ddgs rate limits.
+        # Results are read in variant order, which the dedupe below relies on
+        # for ranking. One failed variant does not discard the others; the
+        # first error is raised only if every variant failed.
         all_results: list[dict[str, str]] = []
-        for query in variants:
-            all_results.extend(
-                _search_web(
+        first_error: Exception | None = None
+        succeeded = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            search_futures = [
+                pool.submit(
+                    _search_web,
                     query=query,
                     region=args.region,
                     max_results=search_limit,
                 )
-            )
+                for query in variants
+            ]
+            for future in search_futures:
+                try:
+                    all_results.extend(future.result())
+                    succeeded += 1
+                except ImportError:
+                    raise
+                except Exception as e:
+                    if first_error is None:
+                        first_error = e
+        if not succeeded and first_error is not None:
+            raise first_error
 
         deduped_candidates: list[dict[str, str]] = []
         seen: set[str] = set()
@@ -276,9 +297,10 @@ def main() -> None:
         domain_counter: Counter[str] = Counter()
         deals: list[dict[str, str | float]] = []
 
+        extracted_by_url = {entry.get("url"): entry for entry in extracted}
         for item in deduped_candidates:
             url = item["url"]
-            match = next((entry for entry in extracted if entry.get("url") == url), None)
+            match = extracted_by_url.get(url)
             if not match or not match.get("ok"):
                 continue
 
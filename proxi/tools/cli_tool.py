@@ -258,8 +258,9 @@ class GetWeatherTool(CLITool):
             },
             command=[sys.executable, "-m", "proxi.scripts.weather", "current"],
             timeout=30,
-            # parallel_safe: each invocation is a stateless HTTP call to Open-Meteo
-            # with no shared mutable state, so concurrent calls are safe.
+            # parallel_safe: HTTP calls to Open-Meteo plus a response cache that
+            # stores one file per key, swapped in atomically from a unique temp
+            # file, so concurrent calls never rewrite each other's entries.
             parallel_safe=True,
             read_only=True,
             defer_loading=True,
@@ -307,7 +308,7 @@ class GetWeatherForecastTool(CLITool):
             command=[sys.executable, "-m",
                      "proxi.scripts.weather", "forecast"],
             timeout=30,
-            # parallel_safe: stateless HTTP calls, no shared mutable state.
+            # parallel_safe: same per-key atomic cache writes as get_weather.
             parallel_safe=True,
             read_only=True,
             defer_loading=True,
@@ -725,6 +726,40 @@ class CalendarDeleteEventTool(CLITool):
         )
 
 
+class CalendarDeleteEventsTool(CLITool):
+    """Delete several calendar events in one call via CLI wrapper."""
+
+    integration_name = "google_calendar"
+
+    def __init__(self) -> None:
+        super().__init__(
+            name="calendar_delete_events",
+            description=(
+                "Delete multiple Google Calendar events by event_ids in a single "
+                "batched request. Prefer this over repeated calendar_delete_event calls."
+            ),
+            parameters_schema={
+                "type": "object",
+                "properties": {
+                    "event_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Google Calendar event IDs to delete",
+                    },
+                    "calendar_id": {"type": "string", "description": "Calendar ID (default: primary)"},
+                },
+                "required": ["event_ids"],
+            },
+            command=[sys.executable, "-m",
+                     "proxi.scripts.calendar", "delete-events"],
+            timeout=30,
+            parallel_safe=True,
+            read_only=False,
+            defer_loading=True,
+            max_retries=2,
+        )
+
+
 class ObsidianListVaultsTool(CLITool):
     """List discovered Obsidian vaults via CLI wrapper."""
 
@@ -1101,6 +1136,7 @@ CLI_TOOLS: list[type[CLITool]] = [
     CalendarGetEventTool,
     CalendarUpdateEventTool,
     CalendarDeleteEventTool,
+    CalendarDeleteEventsTool,
     ObsidianListVaultsTool,
     ObsidianListNotesTool,
     ObsidianReadNoteTool,
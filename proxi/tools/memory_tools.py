@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, TYPE_CHECKING
 
 from proxi.tools.base import BaseTool, ToolResult
@@ -55,8 +56,11 @@ class SearchMemoryTool(BaseTool):
         if not query.strip():
             return ToolResult(output="No query provided.", success=False)
 
-        episodes = await self._memory.search_episodes(query, limit=max_episodes)
-        skills = await self._memory.search_skills(query, limit=max_skills)
+        # Episodes live in SQLite, skills on disk; both searches run off-loop.
+        episodes, skills = await asyncio.gather(
+            self._memory.search_episodes(query, limit=max_episodes),
+            self._memory.search_skills(query, limit=max_skills),
+        )
 
         if not episodes and not skills:
             return ToolResult(output="No relevant memory found for this query.", success=True)
@@ -84,7 +88,6 @@ class SearchMemoryTool(BaseTool):
                 parts.append("")
             # Bump use_count for returned skills (fire-and-forget)
             for skill in skills:
-                import asyncio
                 asyncio.ensure_future(self._memory.increment_skill_use_count(skill.name))
 
         return ToolResult(output="\n".join(parts).strip(), success=True)
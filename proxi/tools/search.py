@@ -15,9 +15,12 @@ if TYPE_CHECKING:
     from proxi.tools.base import Tool
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
 def _tokenize(text: str) -> list[str]:
     """Lowercase and split text into alphanumeric tokens."""
-    return re.findall(r"[a-z0-9]+", text.lower())
+    return _TOKEN_RE.findall(text.lower())
 
 
 @dataclass
@@ -34,7 +37,8 @@ def build_index(tools: "list[Tool]") -> list[ToolSearchEntry]:
     entries: list[ToolSearchEntry] = []
     for t in tools:
         corpus = f"{t.name} {t.description}".lower()
-        entries.append(ToolSearchEntry(tool=t, corpus=corpus, tokens=_tokenize(corpus)))
+        # corpus is already lowercased; skip _tokenize's second lower() copy.
+        entries.append(ToolSearchEntry(tool=t, corpus=corpus, tokens=_TOKEN_RE.findall(corpus)))
     return entries
 
 
@@ -38,6 +38,7 @@ _IS_WINDOWS = sys.platform == "win32"
 # bash -c "..." unwrapper (Unix only — no-op on Windows)
 # ---------------------------------------------------------------------------
 _BASH_WRAPPER_RE = re.compile(r"^\s*bash\s+(-\S+)\s+", re.DOTALL)
+_C_FLAG_RE = re.compile(r"^-[a-zA-Z]*c[a-zA-Z]*$")
 
 
 def _unwrap_bash_c(command: str) -> str:
@@ -60,7 +61,7 @@ def _unwrap_bash_c(command: str) -> str:
     if not tokens or tokens[0] != "bash":
         return command
     for i, tok in enumerate(tokens[1:], 1):
-        if re.match(r"^-[a-zA-Z]*c[a-zA-Z]*$", tok):
+        if _C_FLAG_RE.match(tok):
             if i + 1 < len(tokens):
                 return tokens[i + 1]
             break
@@ -18,7 +18,13 @@ This module provides a filesystem-backed workspace layout:
 
 from __future__ import annotations
 
+import os
+import re
+import shutil
+import time
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import count
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +32,61 @@ import yaml
 
 from proxi.core.state import WorkspaceConfig
 
+# Per-process suffix so sessions created within the same second get distinct ids.
+_session_counter = count()
+
+_BRANCH_SUFFIX_RE = re.compile(r"-\d+$")
+_SLUG_ALLOWED = "abcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+class _SlugTable(dict[int, int]):
+    """``str.translate`` table: allowed chars map to themselves, anything else to ``-``."""
+
+    def __missing__(self, key: int) -> int:
+        return ord("-")
+
+
+_SLUG_TABLE = _SlugTable({ord(ch): ord(ch) for ch in _SLUG_ALLOWED})
+
+
+@lru_cache(maxsize=16)
+def _resolve_absolute(root: Path) -> Path:
+    return root.resolve()
+
+
+def _resolve_root(root: Path) -> Path:
+    """Expand and resolve a workspace root.
+
+    ``resolve()`` readlinks every path component; managers are created per
+    request in the gateway, so absolute roots are memoized. ``~`` is expanded
+    before the lookup and relative roots are never cached, so a changed
+    ``HOME`` or working directory still yields a fresh resolution.
+    """
+    root = root.expanduser()
+    if not root.is_absolute():
+        return root.resolve()
+    return _resolve_absolute(root)
+
+
+def _write_if_absent(path: Path, content: str) -> bool:
+    """Create *path* with *content* unless it already exists.
+
+    Uses ``O_CREAT | O_EXCL`` so the existence check and the create are one
+    atomic syscall. A failed write removes the file again so a later call can
+    retry instead of finding an empty file. Returns True if the file was created.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return True
+
 
 class WorkspaceError(RuntimeError):
     """Raised when workspace operations fail."""
@@ -50,9 +111,12 @@ class SessionInfo:
     plan_path: Path
     todos_path: Path
 
-    @property
+    @cached_property
     def workspace_config(self) -> WorkspaceConfig:
-        """Convert to WorkspaceConfig for attachment to AgentState."""
+        """Convert to WorkspaceConfig for attachment to AgentState.
+
+        Built once per session; later reads return the same instance.
+        """
         root = self.agent.path.parent.parent
         global_dir = root / "global"
         return WorkspaceConfig(
@@ -71,16 +135,14 @@ class WorkspaceManager:
     """Filesystem-backed manager for global, agent, and session workspaces."""
 
     def __init__(self, root: Path | None = None) -> None:
-        from os import getenv
-
-        home_override = getenv("PROXI_HOME")
+        home_override = os.getenv("PROXI_HOME")
         if root is None:
             if home_override:
                 root = Path(home_override).expanduser()
             else:
                 root = Path.home() / ".proxi"
 
-        self.root = root.expanduser().resolve()
+        self.root = _resolve_root(root)
         self.global_dir = self.root / "global"
         self.agents_dir = self.root / "agents"
 
@@ -98,21 +160,22 @@ class WorkspaceManager:
         self.ensure_base_dirs()
         path = self.global_dir / "system_prompt.md"
         if not path.exists():
+            # Read the default before creating anything, so a failed read
+            # cannot leave an empty prompt behind.
             default = Path(__file__).parent / "default_system_prompt.md"
-            path.write_text(default.read_text(encoding="utf-8"), encoding="utf-8")
+            _write_if_absent(path, default.read_text(encoding="utf-8"))
         return path
 
     # --- Agents -----------------------------------------------------------
 
     def list_agents(self) -> list[AgentInfo]:
         """Discover existing agents under agents/."""
-        if not self.agents_dir.exists():
+        try:
+            with os.scandir(self.agents_dir) as it:
+                names = sorted(entry.name for entry in it if entry.is_dir())
+        except FileNotFoundError:
             return []
-        agents: list[AgentInfo] = []
-        for child in sorted(self.agents_dir.iterdir()):
-            if child.is_dir():
-                agents.append(AgentInfo(agent_id=child.name, path=child))
-        return agents
+        return [AgentInfo(agent_id=name, path=self.agents_dir / name) for name in names]
 
     def register_agent_in_gateway(
         self,
@@ -193,14 +256,12 @@ class WorkspaceManager:
         agent_dir.mkdir(parents=True, exist_ok=True)
 
         soul_path = agent_dir / "Soul.md"
-        if not soul_path.exists():
-            soul_content = f"Name: {name}\nPersona: {persona}\n"
-            soul_path.write_text(soul_content, encoding="utf-8")
+        _write_if_absent(soul_path, f"Name: {name}\nPersona: {persona}\n")
 
         config_path = agent_dir / "config.yaml"
-        if not config_path.exists():
-            config_content = "tool_sets:\n  coding: live  # live | deferred | disabled\n"
-            config_path.write_text(config_content, encoding="utf-8")
+        _write_if_absent(
+            config_path, "tool_sets:\n  coding: live  # live | deferred | disabled\n"
+        )
 
         if sync_gateway:
             self.register_agent_in_gateway(
@@ -215,8 +276,6 @@ class WorkspaceManager:
         Sources that pointed at this agent are rewired to another remaining agent.
         Cannot delete the last registered agent (create another first).
         """
-        import shutil
-
         self._validate_agent_id(agent_id)
         self.ensure_base_dirs()
 
@@ -280,16 +339,13 @@ class WorkspaceManager:
         The new agent_id is {base}-2 (or -3, etc.), stripping any existing -N suffix
         so repeated branching stays flat: proxi → proxi-2 → proxi-3.
         """
-        import re
-        import shutil
-
         self._validate_agent_id(parent_agent_id)
         self.ensure_base_dirs()
         parent_dir = self.agents_dir / parent_agent_id
         if not parent_dir.exists():
             raise WorkspaceError(f"Parent agent {parent_agent_id!r} not found")
 
-        base = re.sub(r"-\d+$", "", parent_agent_id)
+        base = _BRANCH_SUFFIX_RE.sub("", parent_agent_id)
         new_agent_id: str | None = None
         for n in range(2, 1000):
             candidate = f"{base}-{n}"
@@ -314,7 +370,7 @@ class WorkspaceManager:
         if src_hist.exists() and src_hist.stat().st_size > 0:
             shutil.copy2(src_hist, dst_hist)
         else:
-            dst_hist.write_text("", encoding="utf-8")
+            dst_hist.touch()
 
         self.register_agent_in_gateway(
             new_agent_id, default_session=default_session, working_dir=working_dir
@@ -329,16 +385,22 @@ class WorkspaceManager:
         Any existing sessions/<*> directories are removed first to enforce
         a single ephemeral session per agent.
         """
-        import shutil
-        from datetime import datetime, timezone
-
         self.ensure_base_dirs()
         sessions_root = agent.path / "sessions"
-        if sessions_root.exists():
+        # Only tear the tree down when something is actually in it; the
+        # session_dir mkdir below recreates sessions/ when needed.
+        try:
+            with os.scandir(sessions_root) as it:
+                stale = next(it, None) is not None
+        except FileNotFoundError:
+            stale = False
+        if stale:
             shutil.rmtree(sessions_root)
-        sessions_root.mkdir(parents=True, exist_ok=True)
 
-        session_id = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        session_id = (
+            time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+            + f"-{next(_session_counter):04d}"
+        )
         session_dir = sessions_root / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -346,8 +408,8 @@ class WorkspaceManager:
         plan_path = session_dir / "plan.md"
         todos_path = session_dir / "todos.md"
 
-        # Initialize empty history file
-        history_path.write_text("", encoding="utf-8")
+        # Initialize empty history file (session_dir is brand new)
+        history_path.touch()
 
         return SessionInfo(
             agent=agent,
@@ -371,8 +433,6 @@ class WorkspaceManager:
         If source_history_path is provided, its content is copied into the new
         session's history.jsonl (for prompt-cache-friendly inheritance).
         """
-        import shutil
-
         self.ensure_base_dirs()
         session_dir = agent.path / "sessions" / session_name
         session_dir.mkdir(parents=True, exist_ok=True)
@@ -384,7 +444,7 @@ class WorkspaceManager:
             else:
                 history_path.write_text("", encoding="utf-8")
         elif not history_path.exists():
-            history_path.write_text("", encoding="utf-8")
+            history_path.touch()
         return SessionInfo(
             agent=agent,
             session_id=session_name,
@@ -396,8 +456,6 @@ class WorkspaceManager:
 
     def delete_session(self, agent_id: str, session_name: str) -> None:
         """Delete a session directory from disk. No-op if it does not exist."""
-        import shutil
-
         session_dir = self.agents_dir / agent_id / "sessions" / session_name
         if session_dir.exists():
             shutil.rmtree(session_dir)
@@ -435,6 +493,4 @@ class WorkspaceManager:
     @staticmethod
     def _slugify(value: str) -> str:
         """Simple filesystem-safe slug from a name."""
-        value = value.strip().lower()
-        allowed = "abcdefghijklmnopqrstuvwxyz0123456789-_"
-        return "".join(ch if ch in allowed else "-" for ch in value)
+        return value.strip().lower().translate(_SLUG_TABLE)
@@ -0,0 +1,91 @@
+"""Tests for batched Google Calendar event deletion."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from proxi.mcp.servers.calendar_tools import CalendarTools
+
+
+class _FakeBatch:
+    def __init__(self, service: "_FakeService", callback) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests: list[tuple[str, str]] = []
+
+    def add(self, request: tuple[str, str], request_id: str) -> None:
+        self._requests.append((request_id, request[1]))
+
+    def execute(self) -> None:
+        self._service.batch_sizes.append(len(self._requests))
+        for request_id, event_id in self._requests:
+            if event_id in self._service.failing:
+                self._callback(request_id, None, RuntimeError(f"{event_id} not found"))
+            else:
+                self._callback(request_id, {}, None)
+
+
+class _FakeEvents:
+    def delete(self, calendarId: str, eventId: str) -> tuple[str, str]:
+        return (calendarId, eventId)
+
+
+class _FakeService:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.batch_sizes: list[int] = []
+
+    def events(self) -> _FakeEvents:
+        return _FakeEvents()
+
+    def new_batch_http_request(self, callback) -> _FakeBatch:
+        return _FakeBatch(self, callback)
+
+
+def _tools(service: _FakeService, monkeypatch: pytest.MonkeyPatch) -> CalendarTools:
+    monkeypatch.setattr(CalendarTools, "_authenticate", lambda self: None)
+    tools = CalendarTools()
+    tools.service = service
+    return tools
+
+
+@pytest.mark.asyncio
+async def test_delete_events_chunks_batches_and_dedupes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Duplicate and empty ids are dropped and requests are split into batches of 50."""
+    service = _FakeService()
+    tools = _tools(service, monkeypatch)
+    ids = [f"evt{i}" for i in range(120)]
+
+    result: dict[str, Any] = await tools.delete_events(ids + ids[:5] + [""])
+
+    assert result["status"] == "deleted"
+    assert result["deleted"] == ids
+    assert result["failed"] == []
+    assert service.batch_sizes == [50, 50, 20]
+
+
+@pytest.mark.asyncio
+async def test_delete_events_reports_partial_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Per-event failures from the batch callback are reported alongside successes."""
+    tools = _tools(_FakeService(failing={"b"}), monkeypatch)
+
+    result = await tools.delete_events(["a", "b", "c"])
+
+    assert result["status"] == "partial"
+    assert result["deleted"] == ["a", "c"]
+    assert [entry["event_id"] for entry in result["failed"]] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_delete_events_all_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """When nothing is deleted the result is an error, not a partial success."""
+    tools = _tools(_FakeService(failing={"a", "b"}), monkeypatch)
+
+    result = await tools.delete_events(["a", "b"])
+
+    assert result["status"] == "failed"
+    assert "error" in result
+    assert result["deleted"] == []
+    assert len(result["failed"]) == 2
@@ -4,7 +4,7 @@ import pytest
 
 from proxi.cli.main import auto_load_cli_tools, build_cli_tool_lists
 from proxi.integrations.catalog import tool_integration
-from proxi.mcp.servers.spotify_server import SPOTIFY_TOOLS
+from proxi.mcp.servers.spotify_server import _TOOL_HANDLERS, SPOTIFY_TOOLS
 from proxi.tools.registry import ToolRegistry
 
 
@@ -85,6 +85,10 @@ def test_spotify_mcp_tool_names_route_to_spotify_integration(entry: dict) -> Non
     assert tool_integration(name) == "spotify", f"{name} must map for MCP enable gating"
 
 
+def test_spotify_mcp_tools_all_have_handlers() -> None:
+    assert {e["name"] for e in SPOTIFY_TOOLS} == set(_TOOL_HANDLERS)
+
+
 @pytest.mark.asyncio
 async def test_auto_load_mcp_skips_when_integration_disabled(
     monkeypatch: pytest.MonkeyPatch,
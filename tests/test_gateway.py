@@ -1030,6 +1030,26 @@ class TestAgentLaneSyncMcpTools:
         assert reg.get("mcp_weather_get_current") is not old_mcp
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Session summarizer client
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSummarizerClient:
+    def test_cheap_model_shares_sdk_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from proxi.gateway.lanes.lane import _build_summarizer_client
+        from proxi.llm.openai import OpenAIClient
+
+        monkeypatch.delenv("PROXI_MEMORY_SUMMARIZER_MODEL", raising=False)
+        main = OpenAIClient(api_key="sk-test", model="gpt-5-mini-2025-08-07")
+
+        summarizer = _build_summarizer_client(main)
+
+        assert summarizer.model == "gpt-4o-mini"
+        assert summarizer.client is main.client
+        assert main.model == "gpt-5-mini-2025-08-07"
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # HttpFormBridge — chat replies while a collaborative form is pending
 # ═══════════════════════════════════════════════════════════════════════════
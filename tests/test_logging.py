@@ -0,0 +1,41 @@
+"""Tests for structured logging file output."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from proxi.observability import logging as logging_module
+from proxi.observability.logging import _BackgroundFileWriter, setup_logging
+
+
+def test_background_writer_flushes_all_lines_in_order(tmp_path: Path) -> None:
+    """close() drains the queue, so every line reaches the file in write order."""
+    path = tmp_path / "proxi.log"
+    writer = _BackgroundFileWriter(path)
+    for idx in range(2000):
+        writer.write(f"line {idx}\n")
+    writer.close()
+
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        f"line {idx}" for idx in range(2000)
+    ]
+    writer.close()  # idempotent
+
+
+def test_setup_logging_closes_previous_file_writer(tmp_path: Path) -> None:
+    """Reconfiguring logging stops the previous writer thread instead of leaking it."""
+    try:
+        setup_logging(use_colors=False, log_file=tmp_path / "first.log")
+        first = logging_module._active_file_writer
+        assert first is not None
+
+        setup_logging(use_colors=False, log_file=tmp_path / "second.log")
+        second = logging_module._active_file_writer
+
+        assert second is not None and second is not first
+        assert not first._thread.is_alive()
+    finally:
+        setup_logging(use_colors=False)
+
+    assert logging_module._active_file_writer is None
+    assert not second._thread.is_alive()
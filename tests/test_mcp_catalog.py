@@ -1,6 +1,10 @@
 """Tests for integration catalog category and routing behavior."""
 
-from proxi.integrations.catalog import known_integrations, tool_integration
+from proxi.integrations.catalog import (
+    TOOL_INTEGRATION_PREFIXES,
+    known_integrations,
+    tool_integration,
+)
 
 
 def test_known_integrations_include_google_calendar() -> None:
@@ -28,6 +32,7 @@ def test_calendar_tools_route_to_google_calendar() -> None:
     assert tool_integration("calendar_get_event") == "google_calendar"
     assert tool_integration("calendar_update_event") == "google_calendar"
     assert tool_integration("calendar_delete_event") == "google_calendar"
+    assert tool_integration("calendar_delete_events") == "google_calendar"
 
 
 def test_obsidian_tools_route_to_obsidian() -> None:
@@ -54,3 +59,24 @@ def test_spotify_tools_route_to_spotify() -> None:
     assert tool_integration("spotify_list_playlists") == "spotify"
     assert tool_integration("spotify_play_playlist") == "spotify"
     assert tool_integration("spotify_add_track_to_playlist") == "spotify"
+
+
+def test_core_tools_have_no_integration() -> None:
+    """Unprefixed and unknown-namespace tool names are core tools."""
+    assert tool_integration("read_file") is None
+    assert tool_integration("shell") is None
+    assert tool_integration("web_search") is None
+
+
+def test_gmail_tools_route_to_gmail() -> None:
+    """Unprefixed Gmail tool names route to the gmail integration by exact name."""
+    assert tool_integration("read_emails") == "gmail"
+    assert tool_integration("send_email") == "gmail"
+    assert tool_integration("get_email") == "gmail"
+
+
+def test_integration_prefixes_are_single_segment() -> None:
+    """Prefix routing keys on the first ``_`` segment, so prefixes must not contain inner ``_``."""
+    for prefix, _ in TOOL_INTEGRATION_PREFIXES:
+        assert prefix.endswith("_")
+        assert "_" not in prefix[:-1], prefix
@@ -0,0 +1,156 @@
+"""Tests for Open-Meteo weather tool caching."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from proxi.mcp.servers import weather_tools as weather_module
+from proxi.mcp.servers.weather_tools import WeatherTools
+
+
+def test_geocode_results_persist_across_instances(
+    proxi_home_env: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Equivalent place names reuse one geocoding request, even in a new process."""
+    calls: list[dict] = []
+
+    def fake_get(self, base_url, params):
+        calls.append(dict(params))
+        return {"results": [{"name": "Paris", "latitude": 48.85, "longitude": 2.35}]}
+
+    monkeypatch.setattr(WeatherTools, "_http_get_json", fake_get)
+
+    first = WeatherTools()._resolve_location("Paris")
+    second = WeatherTools()._resolve_location("  paris ")
+
+    assert first == second
+    assert len(calls) == 1
+    assert list((proxi_home_env / "cache" / "weather" / "geocode").glob("*.json"))
+
+
+def test_concurrent_writers_do_not_drop_entries(proxi_home_env: Path) -> None:
+    """Writers that started from the same on-disk state each keep their own entry."""
+    first = weather_module._DiskCache("geocode")
+    second = weather_module._DiskCache("geocode")
+    assert first.get("a") is None and second.get("b") is None
+
+    first.set("a", {"name": "A"})
+    second.set("b", {"name": "B"})
+
+    fresh = weather_module._DiskCache("geocode")
+    assert fresh.get("a") == {"name": "A"}
+    assert fresh.get("b") == {"name": "B"}
+    assert not list((proxi_home_env / "cache" / "weather" / "geocode").glob("*.tmp"))
+
+
+def test_cache_evicts_oldest_beyond_max_entries(proxi_home_env: Path) -> None:
+    """Writes past max_entries drop the least recently written entries."""
+    cache = weather_module._DiskCache("geocode", max_entries=3)
+    for idx in range(5):
+        cache.set(f"place-{idx}", {"idx": idx})
+        path = cache._path(f"place-{idx}")
+        os.utime(path, ns=(idx * 10**9, idx * 10**9))
+
+    cache.set("place-5", {"idx": 5})
+
+    assert len(list(cache.directory.glob("*.json"))) == 3
+    assert cache.get("place-0") is None
+    assert cache.get("place-5") == {"idx": 5}
+
+
+def test_geocode_entries_expire(
+    proxi_home_env: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A cached geocode is refreshed once its long TTL lapses."""
+    calls: list[dict] = []
+
+    def fake_get(self, base_url, params):
+        calls.append(dict(params))
+        return {"results": [{"name": "Paris", "latitude": 48.85, "longitude": 2.35}]}
+
+    monkeypatch.setattr(WeatherTools, "_http_get_json", fake_get)
+    WeatherTools()._resolve_location("Paris")
+
+    now = weather_module.time.time()
+    later = now + weather_module._GEOCODE_TTL_SECONDS + 1
+    monkeypatch.setattr(weather_module.time, "time", lambda: later)
+    WeatherTools()._resolve_location("Paris")
+
+    assert len(calls) == 2
+
+
+def test_cache_write_failure_is_silent(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """An unwritable cache directory neither raises nor prints to stdout."""
+    blocker = tmp_path / "home"
+    blocker.write_text("not a directory", encoding="utf-8")
+    monkeypatch.setenv("PROXI_HOME", str(blocker))
+
+    weather_module._DiskCache("forecast", ttl=60).set("k", {"v": 1})
+
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.asyncio
+async def test_forecast_reused_within_ttl(
+    proxi_home_env: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated forecasts for the same place hit the network once until the TTL lapses."""
+    calls: list[str] = []
+
+    def fake_get(self, base_url, params):
+        calls.append(base_url)
+        if base_url == WeatherTools.GEOCODING_URL:
+            return {"results": [{"name": "Oslo", "latitude": 59.9, "longitude": 10.7}]}
+        return {"timezone": "Europe/Oslo", "daily": {"time": ["2026-01-01"]}}
+
+    monkeypatch.setattr(WeatherTools, "_http_get_json", fake_get)
+
+    first = await WeatherTools().get_forecast("Oslo", days=1)
+    second = await WeatherTools().get_forecast("Oslo", days=1)
+    assert first == second
+    assert calls.count(WeatherTools.FORECAST_URL) == 1
+
+    now = weather_module.time.time()
+    monkeypatch.setattr(weather_module.time, "time", lambda: now + 3600)
+    await WeatherTools().get_forecast("Oslo", days=1)
+    assert calls.count(WeatherTools.FORECAST_URL) == 2
+
+
+def test_http_get_json_decodes_gzip_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Responses are requested gzip-encoded and decompressed transparently."""
+    seen: dict[str, object] = {}
+
+    class FakeResponse:
+        headers = {"Content-Encoding": "gzip"}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def read(self) -> bytes:
+            return gzip.compress(json.dumps({"ok": True}).encode("utf-8"))
+
+    def fake_urlopen(request, timeout):
+        seen["encoding"] = request.get_header("Accept-encoding")
+        return FakeResponse()
+
+    monkeypatch.setattr(weather_module, "urlopen", fake_urlopen)
+
+    payload = WeatherTools()._http_get_json(WeatherTools.FORECAST_URL, {"latitude": 1})
+
+    assert payload == {"ok": True}
+    assert seen["encoding"] == "gzip"
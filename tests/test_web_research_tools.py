@@ -292,3 +292,43 @@ def test_web_research_shopping_mode_returns_deals(monkeypatch: pytest.MonkeyPatc
     assert payload["shopping_mode"] is True
     assert payload["deal_count"] >= 1
     assert all(item["price"] <= 30 for item in payload["deals"])
+
+
+def test_web_research_survives_a_failed_variant(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_search_web(query: str, region: str | None, max_results: int):
+        calls.append(query)
+        if len(calls) == 1:
+            raise RuntimeError("ratelimit")
+        return [
+            {
+                "title": "B",
+                "url": f"https://other.com/{len(calls)}",
+                "description": "desc B",
+                "domain": "other.com",
+                "rank": 1,
+                "query": query,
+            }
+        ]
+
+    def fake_extract(url: str, max_chars: int = 5000):
+        return {
+            "url": url,
+            "final_url": url,
+            "content_type": "text/html",
+            "title": "Title",
+            "content": "Enough extracted content to count as a real source for the research.",
+            "ok": True,
+        }
+
+    monkeypatch.setattr(web_research, "_search_web", fake_search_web)
+    monkeypatch.setattr(web_research, "_extract_url", fake_extract)
+
+    code, payload = _run_main(
+        web_research.main,
+        ["web_research.py", "--query=ai agent frameworks", "--depth=deep"],
+    )
+    assert code == 0
+    assert len(calls) > 1
+    assert payload["source_count"] >= 1
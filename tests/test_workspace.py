@@ -73,11 +73,34 @@ def test_ensure_global_system_prompt(proxi_home_env: Path) -> None:
     assert "Proxi" in path.read_text()
 
 
+def test_ensure_global_system_prompt_failed_read_leaves_no_file(
+    proxi_home_env: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failing default read creates nothing, so the next call can still write it."""
+    mgr = WorkspaceManager()
+    original = Path.read_text
+
+    def failing_read(self: Path, *args, **kwargs) -> str:
+        if self.name == "default_system_prompt.md":
+            raise OSError("unreadable")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", failing_read)
+    with pytest.raises(OSError):
+        mgr.ensure_global_system_prompt()
+    assert not (mgr.global_dir / "system_prompt.md").exists()
+
+    monkeypatch.setattr(Path, "read_text", original)
+    assert "Proxi" in mgr.ensure_global_system_prompt().read_text()
+
+
 def test_slugify() -> None:
     """_slugify produces filesystem-safe slugs."""
     assert WorkspaceManager._slugify("Hello World") == "hello-world"
     assert WorkspaceManager._slugify("Test Agent 123") == "test-agent-123"
     assert WorkspaceManager._slugify("  ") == ""
+    assert WorkspaceManager._slugify("Zoë's Bot!") == "zo--s-bot-"
 
 
 def test_delete_agent_removes_folder_and_gateway(proxi_home_env: Path) -> None:
@@ -100,3 +123,56 @@ def test_delete_last_agent_fails(proxi_home_env: Path) -> None:
     mgr.create_agent(name="Only", persona="x", agent_id="only")
     with pytest.raises(WorkspaceError, match="last agent"):
         mgr.delete_agent("only")
+
+
+def test_session_workspace_config_is_cached(proxi_home_env: Path) -> None:
+    """workspace_config is built once and reused for the session."""
+    mgr = WorkspaceManager()
+    agent = mgr.create_agent(name="C", persona="x")
+    session = mgr.create_single_session(agent)
+    cfg = session.workspace_config
+    assert cfg is session.workspace_config
+    assert mgr.build_workspace_config(session) is cfg
+    assert cfg.history_path == str(session.history_path)
+
+
+def test_create_single_session_ids_are_unique(proxi_home_env: Path) -> None:
+    """Back-to-back sessions in the same second get distinct ids."""
+    mgr = WorkspaceManager()
+    agent = mgr.create_agent(name="U", persona="x")
+    first = mgr.create_single_session(agent)
+    second = mgr.create_single_session(agent)
+    assert first.session_id != second.session_id
+    assert not first.session_dir.exists()
+    assert second.session_dir.exists()
+
+
+def test_create_agent_keeps_existing_soul(proxi_home_env: Path) -> None:
+    """create_agent does not overwrite an existing Soul.md."""
+    mgr = WorkspaceManager()
+    info = mgr.create_agent(name="Keep", persona="x", sync_gateway=False)
+    soul = info.path / "Soul.md"
+    soul.write_text("custom", encoding="utf-8")
+    mgr.create_agent(name="Keep", persona="y", sync_gateway=False)
+    assert soul.read_text(encoding="utf-8") == "custom"
+
+
+def test_relative_root_follows_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A relative root resolves against the current directory at construction time."""
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert WorkspaceManager(root=Path("ws")).root == first.resolve() / "ws"
+    monkeypatch.chdir(second)
+    assert WorkspaceManager(root=Path("ws")).root == second.resolve() / "ws"
+
+
+def test_home_relative_root_follows_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """``~`` is expanded on every construction, not frozen by the resolve cache."""
+    monkeypatch.setenv("HOME", str(tmp_path / "one"))
+    assert WorkspaceManager(root=Path("~/ws")).root == (tmp_path / "one" / "ws").resolve()
+    monkeypatch.setenv("HOME", str(tmp_path / "two"))
+    assert WorkspaceManager(root=Path("~/ws")).root == (tmp_path / "two" / "ws").resolve()